@@ -1,38 +1,93 @@
-import tempfile
+import os
+import shutil
+import subprocess
 from pathlib import Path
-from pydub import AudioSegment
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class AudioExtractor:
-    """Получение аудио дорожки и конвертация в WAV MONO 16kHz."""
+    """Получение аудио дорожки в виде PCM MONO 16kHz 16 bit."""
 
     SAMPLE_RATE = 16000
     CHANNELS = 1
+    SAMPLE_WIDTH = 2
+
+    # Resolved once instead of walking PATH for every input file
+    FFMPEG = shutil.which("ffmpeg")
 
     @staticmethod
-    def extract_audio(input_file: Path) -> Path:
-        """Получение аудио дорожки и конвертация в WAV MONO 16kHz."""
+    def extract_audio(input_file: Path) -> bytes:
+        """Получение аудио дорожки и конвертация в PCM s16le MONO 16kHz в памяти."""
         logger.info(f"Получение аудио дорожки из: {input_file}")
 
-        # Create temporary file
-        temp_wav = Path(tempfile.gettempdir()) / "audio_temp.wav"
+        source = os.fspath(input_file)
 
         try:
-            # Load audio from any format
-            audio = AudioSegment.from_file(str(input_file))
-
-            # Convert to mono and set frame rate
-            audio = audio.set_channels(AudioExtractor.CHANNELS)
-            audio = audio.set_frame_rate(AudioExtractor.SAMPLE_RATE)
+            if AudioExtractor.FFMPEG:
+                pcm = AudioExtractor._extract_with_ffmpeg(source)
+            else:
+                logger.warning("ffmpeg не найден, используется pydub")
+                pcm = AudioExtractor._extract_with_pydub(source)
 
-            # Export to WAV
-            audio.export(str(temp_wav), format="wav")
-            logger.info(f"Аудио дорожка получена в {temp_wav}")
+            duration = len(pcm) / (AudioExtractor.SAMPLE_RATE * AudioExtractor.SAMPLE_WIDTH)
+            logger.info(f"Аудио дорожка получена: {duration:.1f} сек")
 
-            return temp_wav
+            return pcm
         except Exception as e:
             logger.error(f"Ошибка при получении аудио дорожки: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def _extract_with_ffmpeg(source: str) -> bytes:
+        """Декодирование, понижение до моно и ресемплинг за один проход ffmpeg в pipe."""
+        command = [
+            AudioExtractor.FFMPEG, "-nostdin", "-v", "error",
+            "-i", source,
+            "-vn",
+            "-ac", str(AudioExtractor.CHANNELS),
+            "-ar", str(AudioExtractor.SAMPLE_RATE),
+            "-f", "s16le",
+            "pipe:1",
+        ]
+
+        # No terminal stdin: parallel ffmpeg runs must not read keys or touch tty settings
+        result = subprocess.run(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            error = result.stderr.decode(errors='replace').strip()
+            raise RuntimeError(f"ffmpeg завершился с кодом {result.returncode}: {error}")
+
+        return result.stdout
+
+    @staticmethod
+    def _extract_with_pydub(source: str) -> bytes:
+        """
+        Запасной вариант через pydub, если ffmpeg недоступен в PATH.
+
+        pydub используется только для декодирования, понижение до моно и
+        ресемплинг делаются одним векторным проходом numpy/scipy.
+        """
+        import numpy as np
+        from pydub import AudioSegment
+        from scipy.signal import resample_poly
+
+        # Load audio from any format
+        audio = AudioSegment.from_file(source)
+        if audio.sample_width != AudioExtractor.SAMPLE_WIDTH:
+            audio = audio.set_sample_width(AudioExtractor.SAMPLE_WIDTH)
+
+        # Downmix to mono
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, audio.channels)
+        mono = samples.mean(axis=1)
+
+        # Polyphase resample to 16kHz
+        if audio.frame_rate != AudioExtractor.SAMPLE_RATE:
+            mono = resample_poly(mono, AudioExtractor.SAMPLE_RATE, audio.frame_rate)
+
+        return np.clip(np.rint(mono), -32768, 32767).astype(np.int16).tobytes()
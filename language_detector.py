@@ -1,10 +1,98 @@
 import re
-from typing import Tuple, Set, Optional
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple, Set, Optional, List
 import logging
+import marisa_trie
 from spellchecker import SpellChecker
 
 logger = logging.getLogger(__name__)
 
+_CYR_LETTERS = (
+    [chr(c) for c in range(ord('а'), ord('я') + 1)]
+    + [chr(c) for c in range(ord('А'), ord('Я') + 1)]
+    + ['ё', 'Ё']
+)
+_CYR_MARK = '\x01'
+_LAT_MARK = '\x02'
+# Maps every Cyrillic/Latin letter to a marker so both can be counted with str.count
+_ALPHABET_TABLE = str.maketrans({
+    **{c: _CYR_MARK for c in _CYR_LETTERS},
+    **{c: _LAT_MARK for c in string.ascii_letters},
+})
+_CYR_WORD_RE = re.compile(r'[а-яёА-ЯЁ]+')
+
+# Типичные короткие русские слова (не признак транслитерации)
+_COMMON_RU = frozenset({
+    'я', 'а', 'в', 'с', 'к', 'и', 'по', 'на', 'не', 'до',
+    'да', 'то', 'он', 'ты', 'мы', 'тут', 'шёл', 'шла', 'шли', 'она',
+    'они', 'оно', 'это', 'или', 'но', 'мне', 'тебе', 'ему', 'ей', 'им',
+    'вас', 'нас', 'там', 'чего', 'того', 'этот', 'такой', 'какой', 'кто', 'что',
+    'где', 'как', 'когда', 'зачем', 'ну', 'же', 'вот', 'уж', 'уже', 'даже',
+    'все', 'весь', 'каждый', 'мой', 'твой', 'его', 'её', 'наш', 'ваш', 'их',
+    'хорош', 'плохо', 'хорошо', 'плох', 'дай', 'возьми', 'пойди', 'иди', 'дайте', 'возьмите',
+    'идите', 'слушай', 'смотри', 'помогу', 'помоги', 'помогите', 'спасибо', 'пожалуйста', 'извините', 'извини',
+    'тебя', 'за', 'у', 'из', 'бы', 'так', 'еще', 'был', 'вы', 'быть',
+    'нет', 'может', 'над', 'при', 'для', 'без', 'под', 'про', 'лишь', 'только',
+    'во', 'от', 'ли', 'ни', 'де', 'ми', 'те', 'бе', 'ре', 'ве',
+    'ви', 'ди', 'ле', 'ме', 'се', 'че', 'ше', 'чему', 'чем', 'чей',
+    'чья', 'чьё', 'чьи', 'свой', 'один', 'два', 'три', 'четыре', 'пять', 'шесть',
+    'семь', 'восемь', 'девять', 'десять', 'ноль', 'нуль', 'первый', 'второй', 'третий', 'четвёртый',
+    'пятый', 'большой', 'малый', 'новый', 'старый', 'добрый', 'злой', 'хороший', 'плохой', 'красивый',
+    'умный', 'глупый', 'быстро', 'медленно', 'легкий', 'трудный', 'простой', 'сложный', 'горячий', 'холодный',
+    'светлый', 'темный', 'чистый', 'грязный', 'веселый', 'грустный', 'радостный', 'печальный', 'счастливый', 'несчастный',
+    'честный', 'лживый', 'правдивый', 'важный', 'интересный', 'скучный', 'ранний', 'поздний', 'дальний', 'ближний',
+    'левый', 'правый', 'верхний', 'нижний', 'дом', 'дверь', 'окно', 'стол', 'стул', 'кровать',
+    'книга', 'ручка', 'ручей', 'река', 'озеро', 'море', 'лес', 'поле', 'гора', 'город',
+    'улица', 'школа', 'мама', 'папа', 'брат', 'сестра', 'сын', 'дочь', 'муж', 'жена',
+    'друг', 'человек', 'люди', 'мальчик', 'девочка', 'девушка', 'юноша', 'старик', 'баба', 'бабушка',
+    'дедушка', 'врач', 'учитель', 'ученик', 'студент', 'работник', 'начальник', 'сосед', 'знакомый', 'враг',
+    'глаз', 'нос', 'рот', 'ухо', 'рука', 'нога', 'голова', 'волос', 'зуб', 'язык',
+    'сердце', 'печень', 'воздух', 'огонь', 'вода', 'земля', 'камень', 'песок', 'трава', 'цветок',
+    'дерево', 'лист', 'ветка', 'корень', 'хлеб', 'молоко', 'масло', 'мясо', 'рыба', 'яйцо',
+    'суп', 'каша', 'борщ', 'блюдо', 'чашка', 'ложка', 'вилка', 'нож', 'пища', 'еда',
+    'напиток', 'чай', 'кофе', 'вино', 'пиво', 'спирт', 'газ', 'пар', 'дым', 'запах',
+    'вкус', 'звук', 'музыка', 'песня', 'танец', 'картина', 'рисунок', 'фото', 'кино', 'театр',
+    'цирк', 'игра', 'спорт', 'мяч', 'лыжа', 'коньки', 'горка', 'елка', 'праздник', 'день',
+    'ночь', 'утро', 'вечер', 'час', 'минута', 'секунда', 'год', 'месяц', 'неделя', 'работа',
+    'дело', 'занятие', 'класс', 'урок', 'оценка', 'пятёрка', 'четвёрка', 'тройка', 'двойка', 'единица',
+    'экзамен', 'поэт', 'писатель', 'артист', 'певец', 'танцор', 'музыкант', 'художник', 'скульптор', 'архитектор',
+    'инженер', 'механик', 'электрик', 'сантехник', 'каменщик', 'плотник', 'кузнец', 'портной', 'сапожник', 'парикмахер',
+    'флорист', 'садовник', 'пастух', 'рыбак', 'охотник', 'летчик', 'капитан', 'матрос', 'солдат', 'офицер',
+    'генерал', 'король', 'королева', 'князь', 'граф', 'герцог', 'барон', 'дворянин', 'боярин', 'хозяин',
+    'хозяйка', 'слуга', 'служитель', 'раб', 'крестьянин', 'крестьянка', 'купец', 'ремесленник', 'безработный', 'инвалид',
+    'сирота', 'вдова', 'вдовец', 'холостяк', 'молодой', 'молодежь', 'молодость', 'возраст', 'старость', 'детство',
+    'много', 'немного', 'несколько', 'мало', 'совсем', 'вовсе', 'очень', 'весьма', 'сильно', 'слабо',
+    'почти', 'примерно', 'приблизительно', 'около', 'больше', 'меньше', 'лучше', 'хуже', 'быстрее', 'медленнее',
+    'выше', 'ниже', 'дальше', 'ближе', 'раньше', 'позже', 'скорее', 'разнообразнее', 'проще', 'сложнее',
+    'глубже', 'мельче', 'шире', 'длиннее', 'короче', 'толще', 'тоньше', 'светлее', 'темнее', 'ярче',
+    'бледнее', 'красивее', 'некрасивее', 'странно', 'неправда', 'правда', 'конечно', 'наверное', 'возможно', 'невозможно',
+    'именно', 'точно', 'здесь', 'туда', 'сюда', 'оттуда', 'отсюда', 'везде', 'всюду', 'нигде',
+    'никуда', 'откуда', 'кудаже', 'далеко', 'близко', 'рядом', 'вместе', 'отдельно', 'другой', 'иной',
+    'любой', 'никакой', 'всякий', 'известный', 'неизвестный', 'знаменитый', 'ужас', 'страх', 'страшный', 'ужасный',
+    'замечательно', 'отлично', 'кое', 'сам', 'себя', 'себе', 'собой', 'собою', 'начинать', 'заканчивать',
+    'продолжать', 'останавливаться', 'ждать', 'искать', 'находить', 'терять', 'помнить', 'забывать', 'думать', 'верить',
+    'сомневаться', 'решать', 'выбирать', 'соглашаться', 'отказываться', 'спрашивать', 'отвечать', 'рассказывать', 'обещать', 'выполнять',
+    'нарушать', 'помогать', 'мешать', 'благодарить', 'извиняться', 'праздновать', 'печалиться', 'радоваться', 'удивляться', 'страдать',
+    'любить', 'ненавидеть', 'знать', 'понимать', 'говорить', 'читать', 'писать', 'слушать', 'смотреть', 'делать',
+    'работать', 'учиться', 'играть', 'ходить', 'бежать', 'прыгать', 'плавать', 'летать', 'ехать', 'приезжать',
+    'уезжать', 'приходить', 'уходить', 'сидеть', 'лежать', 'стоять', 'падать', 'вставать', 'ложиться', 'дать',
+    'взять', 'иметь', 'хотеть', 'нужно', 'надо', 'можно', 'нельзя', 'красиво', 'союз',
+})
+
+
+@dataclass
+class _TextFeatures:
+    """Признаки текста, собранные один раз для всех этапов оценки качества."""
+
+    text_length: int
+    words_lower: List[str]
+    cyrillic_count: int
+    latin_count: int
+    letter_count: int
+    russian_words: List[str]
+
 
 class LanguageDetector:
     """
@@ -12,7 +100,7 @@ class LanguageDetector:
 
     Особенности:
     1. Распознавание кириллицы/латиницы
-    2. Интеграция проверки орфографии (pyspellchecker)
+    2. Интеграция проверки орфографии (словарь pyspellchecker в marisa-trie)
     3. Оценка русского языка с учетом контекста
     4. Частотный анализ слов
     5. Определение транслитерации с высокой точностью
@@ -24,26 +112,75 @@ class LanguageDetector:
     MIN_AVG_WORD_LENGTH = 3.2
     MIN_VERY_LONG_WORDS_RATIO = 0.15
 
-    # Lazy-loaded spell checkers
-    _spell_ru: Optional[SpellChecker] = None
-    _spell_en: Optional[SpellChecker] = None
+    # Типичные короткие русские слова (не признак транслитерации)
+    COMMON_SHORT_RUSSIAN_WORDS = _COMMON_RU
+
+    # Lazy-loaded spell checking dictionaries
+    _dictionary_ru: Optional[marisa_trie.Trie] = None
+    _dictionary_en: Optional[marisa_trie.Trie] = None
 
 
     @classmethod
-    def _get_spell_checker_ru(cls) -> SpellChecker:
-        """Получение или инициализация программы проверки орфографии на русском языке."""
-        if cls._spell_ru is None:
+    def _get_dictionary_ru(cls) -> marisa_trie.Trie:
+        """Получение или инициализация словаря для проверки орфографии на русском языке."""
+        if cls._dictionary_ru is None:
             logger.info("Инициализация программы проверки...")
-            cls._spell_ru = SpellChecker(language='ru')
-        return cls._spell_ru
+            cls._dictionary_ru = cls._build_dictionary('ru')
+        return cls._dictionary_ru
 
     @classmethod
-    def _get_spell_checker_en(cls) -> SpellChecker:
-        """Получение или инициализация программы проверки орфографии на английском языке."""
-        if cls._spell_en is None:
+    def _get_dictionary_en(cls) -> marisa_trie.Trie:
+        """Получение или инициализация словаря для проверки орфографии на английском языке."""
+        if cls._dictionary_en is None:
             logger.info("Инициализация программы проверки...")
-            cls._spell_en = SpellChecker(language='en')
-        return cls._spell_en
+            cls._dictionary_en = cls._build_dictionary('en')
+        return cls._dictionary_en
+
+    @staticmethod
+    def _build_dictionary(language: str) -> marisa_trie.Trie:
+        """
+        Построение компактного словаря из списка слов pyspellchecker.
+
+        Нужна только проверка наличия слова, поэтому сам SpellChecker
+        с частотным словарём после построения не хранится.
+        """
+        spell_checker = SpellChecker(language=language)
+        return marisa_trie.Trie(spell_checker.word_frequency.dictionary.keys())
+
+    @staticmethod
+    def _is_checkable(word: str) -> bool:
+        """Пунктуация и числа не проверяются, как и в pyspellchecker."""
+        if len(word) == 1 and word in string.punctuation:
+            return False
+        if word in ("nan", "inf", "infinity"):
+            return True
+        try:
+            float(word)
+        except ValueError:
+            return True
+        return False
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _is_known_ru(word: str) -> bool:
+        """Кэшированная проверка слова по русскому словарю."""
+        return not LanguageDetector._is_checkable(word) or word in LanguageDetector._get_dictionary_ru()
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _is_known_en(word: str) -> bool:
+        """Кэшированная проверка слова по английскому словарю."""
+        return not LanguageDetector._is_checkable(word) or word in LanguageDetector._get_dictionary_en()
+
+    @staticmethod
+    def _count_letters(text: str) -> Tuple[int, int, int]:
+        """Подсчёт кириллических, латинских и всех букв через таблицу перекодировки."""
+        marked = text.translate(_ALPHABET_TABLE)
+        cyrillic_count = marked.count(_CYR_MARK)
+        latin_count = marked.count(_LAT_MARK)
+        letter_count = sum(map(str.isalpha, text))
+
+        return cyrillic_count, latin_count, letter_count
 
     @staticmethod
     def detect_language(text: str) -> str:
@@ -56,9 +193,12 @@ class LanguageDetector:
         - 'mixed': Both present (40-60% mix)
         - 'unknown': No alphabet found
         """
-        cyrillic_count = len(re.findall(r'[а-яёА-ЯЁ]', text))
-        latin_count = len(re.findall(r'[a-zA-Z]', text))
+        cyrillic_count, latin_count, _ = LanguageDetector._count_letters(text)
+        return LanguageDetector._language_from_counts(cyrillic_count, latin_count)
 
+    @staticmethod
+    def _language_from_counts(cyrillic_count: int, latin_count: int) -> str:
+        """Определение языка по количеству кириллических и латинских букв."""
         if cyrillic_count == 0 and latin_count == 0:
             return "unknown"
 
@@ -72,8 +212,9 @@ class LanguageDetector:
         else:
             return "mixed"
 
-    @classmethod
-    def assess_quality(cls, text: str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def assess_quality(text: str) -> float:
         """
         Комплексная оценка качества, сочетающая в себе множество факторов.
 
@@ -82,34 +223,54 @@ class LanguageDetector:
         2. Штраф за проверку орфографии (слова с ошибками в написании)
         3. Контекстный бонус (общеупотребительные русские слова, связность)
 
+        Результат зависит только от текста и кэшируется.
+
         return: 0,0-1,0 (выше = лучшее качество)
         """
         if not text.strip():
             return 0.0
 
-        base_score = cls._calculate_base_score(text)
-        spell_penalty = cls._calculate_spell_penalty(text)
-        context_bonus = cls._calculate_context_bonus(text)
+        features = LanguageDetector._extract_features(text)
+        language = LanguageDetector._language_from_counts(features.cyrillic_count, features.latin_count)
+
+        base_score = LanguageDetector._calculate_base_score(features)
+        spell_penalty = LanguageDetector._calculate_spell_penalty(features, language)
+        context_bonus = LanguageDetector._calculate_context_bonus(features, language)
 
         final_score = (base_score * 0.7 + context_bonus * 0.3) * spell_penalty
 
         return min(max(final_score, 0.0), 1.0)
 
     @classmethod
-    def _calculate_base_score(cls, text: str) -> float:
+    def _extract_features(cls, text: str) -> _TextFeatures:
+        """Сбор всех признаков текста, нужных для оценки качества."""
+        text_lower = text.lower()
+        cyrillic_count, latin_count, letter_count = cls._count_letters(text)
+        russian_words = _CYR_WORD_RE.findall(text_lower) if cyrillic_count else []
+
+        return _TextFeatures(
+            text_length=len(text),
+            words_lower=text_lower.split(),
+            cyrillic_count=cyrillic_count,
+            latin_count=latin_count,
+            letter_count=letter_count,
+            russian_words=russian_words,
+        )
+
+    @staticmethod
+    def _calculate_base_score(features: _TextFeatures) -> float:
         """Расчёт основных показателей качества."""
-        words = text.split()
-        word_count = len(words)
-        letter_count = len([c for c in text if c.isalpha()])
+        word_count = len(features.words_lower)
+        letter_count = features.letter_count
 
         word_score = min(word_count / 10, 1.0) * 0.2
         letter_score = min(letter_count / 50, 1.0) * 0.2
 
-        cyrillic_ratio = len(re.findall(r'[а-яёА-ЯЁ]', text)) / max(letter_count, 1)
-        latin_ratio = len(re.findall(r'[a-zA-Z]', text)) / max(letter_count, 1)
+        cyrillic_ratio = features.cyrillic_count / max(letter_count, 1)
+        latin_ratio = features.latin_count / max(letter_count, 1)
         alphabet_score = max(cyrillic_ratio, latin_ratio) * 0.2
 
-        text_len = len(text)
+        text_len = features.text_length
         if 10 < text_len < 200:
             length_score = 0.2
         elif text_len < 5 or text_len > 300:
@@ -120,7 +281,7 @@ class LanguageDetector:
         return word_score + letter_score + alphabet_score + length_score + 0.2
 
     @classmethod
-    def _calculate_spell_penalty(cls, text: str) -> float:
+    def _calculate_spell_penalty(cls, features: _TextFeatures, language: str) -> float:
         """
         Расчёт штрафа за проверку орфографии на основе орфографической ошибки.
 
@@ -130,40 +291,36 @@ class LanguageDetector:
         - 20% ошибок - 0,6
         - 50% ошибок - 0,0
                 """
-        language = LanguageDetector.detect_language(text)
-
         if language == "ru":
-            spell_checker = cls._get_spell_checker_ru()
-            words = text.lower().split()
-            misspelled = spell_checker.unknown(words)
+            words = features.words_lower
+            misspelled = {w for w in set(words) if not cls._is_known_ru(w)}
             error_ratio = len(misspelled) / max(len(words), 1)
 
             penalty = max(1.0 - (error_ratio * 2.5), 0.0)
 
             logger.debug(
-                f"Проверка RU языка: {len(misspelled)}/{len(words)} "
-                f"опечатка ({error_ratio * 100:.1f}%) → штраф={penalty:.2f}"
+                "Проверка RU языка: %d/%d опечатка (%.1f%%) → штраф=%.2f",
+                len(misspelled), len(words), error_ratio * 100, penalty
             )
             return penalty
 
         elif language == "en":
-            spell_checker = cls._get_spell_checker_en()
-            words = text.lower().split()
-            misspelled = spell_checker.unknown(words)
+            words = features.words_lower
+            misspelled = {w for w in set(words) if not cls._is_known_en(w)}
             error_ratio = len(misspelled) / max(len(words), 1)
 
             penalty = max(1.0 - (error_ratio * 2.5), 0.0)
 
             logger.debug(
-                f"Проверка EN языка: {len(misspelled)}/{len(words)} "
-                f"опечатка ({error_ratio * 100:.1f}%) → штраф={penalty:.2f}"
+                "Проверка EN языка: %d/%d опечатка (%.1f%%) → штраф=%.2f",
+                len(misspelled), len(words), error_ratio * 100, penalty
             )
             return penalty
 
         return 0.8
 
     @classmethod
-    def _calculate_context_bonus(cls, text: str) -> float:
+    def _calculate_context_bonus(cls, features: _TextFeatures, language: str) -> float:
         """
         Расчёт бонуса за согласованность контекста для русского текста.
 
@@ -171,20 +328,15 @@ class LanguageDetector:
         1. Наличие общеупотребительных русских слов (50%)
         2. Средняя длина слова (50%)
         """
-        language = LanguageDetector.detect_language(text)
-
         if language != "ru":
             return 0.0
 
-        russian_words = re.findall(r'[а-яёА-ЯЁ]+', text.lower())
+        russian_words = features.russian_words
 
         if not russian_words:
             return 0.0
 
-        common_count = sum(
-            1 for w in russian_words
-            if w in cls.COMMON_SHORT_RUSSIAN_WORDS
-        )
+        common_count = sum(1 for w in russian_words if w in _COMMON_RU)
         common_ratio = common_count / len(russian_words)
         common_score = min(common_ratio * 2, 1.0)
 
@@ -194,127 +346,72 @@ class LanguageDetector:
         context_score = common_score * 0.5 + length_score * 0.5
 
         logger.debug(
-            f"Анализ контекста: {common_ratio * 100:.1f}% обычных слов, "
-            f"сред. длина={avg_length:.2f} → оценка контекст={context_score:.2f}"
+            "Анализ контекста: %.1f%% обычных слов, сред. длина=%.2f → оценка контекст=%.2f",
+            common_ratio * 100, avg_length, context_score
         )
 
         return context_score
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def is_transliteration(text: str) -> bool:
         """
         Определяет, переведен ли текст на английский (а не на русский). (Транслит)
 
-        Возвращает значение True, если это вероятная транслитерация, и False, если это настоящая русская
+        Возвращает значение True, если это вероятная транслитерация, и False, если это настоящая русская.
+        Тексты короче трёх слов не проверяются и считаются настоящими.
         """
-        russian_words = re.findall(r'[а-яА-ЯёЁ]+', text.lower())
+        # Short texts don't carry enough signal, skip before lowering and regex
+        if len(text) < 8 or text.count(' ') < 2:
+            return False
+
+        russian_words = _CYR_WORD_RE.findall(text.lower())
 
         if not russian_words:
             return False
 
         total_words = len(russian_words)
-        word_lengths = [len(word) for word in russian_words]
-
-        avg_length = sum(word_lengths) / total_words
-        very_short_ratio = sum(1 for l in word_lengths if l <= 2) / total_words
-        very_long_ratio = sum(1 for l in word_lengths if l >= 5) / total_words
 
-        common_russian_count = sum(
-            1 for word in russian_words
-            if word in LanguageDetector.COMMON_SHORT_RUSSIAN_WORDS
-        )
+        common_words = _COMMON_RU
+        common_russian_count = sum(1 for word in russian_words if word in common_words)
         common_ratio = common_russian_count / total_words
 
         if common_ratio > 0.4:
             logger.info(
-                f"Реальный русский язык обнаружен: {common_ratio * 100:.1f}% обычных слов"
+                "Реальный русский язык обнаружен: %.1f%% обычных слов", common_ratio * 100
             )
             return False
 
-        criteria_met = 0
-        details = []
-
-        if very_short_ratio > LanguageDetector.MAX_VERY_SHORT_WORDS_RATIO:
-            criteria_met += 1
-            details.append(f"very_short={very_short_ratio * 100:.1f}%")
+        word_lengths = [len(word) for word in russian_words]
 
-        if avg_length < LanguageDetector.MIN_AVG_WORD_LENGTH:
-            criteria_met += 1
-            details.append(f"avg_len={avg_length:.2f}")
+        avg_length = sum(word_lengths) / total_words
+        very_short_ratio = sum(1 for length in word_lengths if length <= 2) / total_words
+        very_long_ratio = sum(1 for length in word_lengths if length >= 5) / total_words
 
-        if very_long_ratio < LanguageDetector.MIN_VERY_LONG_WORDS_RATIO:
-            criteria_met += 1
-            details.append(f"long_words={very_long_ratio * 100:.1f}%")
+        too_many_short = very_short_ratio > LanguageDetector.MAX_VERY_SHORT_WORDS_RATIO
+        too_short_avg = avg_length < LanguageDetector.MIN_AVG_WORD_LENGTH
+        too_few_long = very_long_ratio < LanguageDetector.MIN_VERY_LONG_WORDS_RATIO
 
+        criteria_met = too_many_short + too_short_avg + too_few_long
         is_transliteration_result = criteria_met >= 2
 
-        logger.info(
-            f"Проверка на транслит: '{text[:50]}...' "
-            f"({criteria_met}/3 критериев: {', '.join(details)}) "
-            f"→ {'TRANSLITERATION' if is_transliteration_result else 'REAL RUSSIAN'}"
-        )
+        # The criteria details are only formatted when they will be shown
+        if logger.isEnabledFor(logging.INFO):
+            details = []
 
-        return is_transliteration_result
+            if too_many_short:
+                details.append(f"very_short={very_short_ratio * 100:.1f}%")
 
-    # Типичные короткие русские слова (не признак транслитерации)
-    COMMON_SHORT_RUSSIAN_WORDS = {
-        'я', 'а', 'в', 'с', 'к', 'и', 'по', 'на', 'не', 'до', 'да', 'то', 'он', 'ты', 'мы', 'тут', 'шёл', 'шла', 'шли'
-        'она', 'они', 'оно', 'это', 'или', 'но', 'мне', 'тебе', 'ему', 'ей', 'им', 'вас', 'нас', 'там', 'чего',
-        'того', 'этот', 'такой', 'какой', 'кто', 'что', 'где', 'как', 'когда', 'зачем',
-        'ну', 'же', 'вот', 'уж', 'уже', 'даже', 'все', 'весь', 'каждый', 'мой', 'твой',
-        'его', 'её', 'наш', 'ваш', 'их', 'хорош', 'плохо', 'хорошо', 'плох', 'дай',
-        'возьми', 'пойди', 'иди', 'дайте', 'возьмите', 'идите', 'слушай', 'смотри',
-        'помогу', 'помоги', 'помогите', 'спасибо', 'пожалуйста', 'извините', 'извини',
-        'тебя', 'тебе', 'в', 'не', 'на', 'с', 'я', 'что', 'он', 'она', 'они',
-        'как', 'но', 'до', 'по', 'за', 'к', 'у', 'же', 'мне', 'ты',
-        'из', 'бы', 'то', 'так', 'его', 'все', 'еще', 'был', 'там', 'да',
-        'вы', 'быть', 'нет', 'это', 'может', 'они', 'над', 'при', 'для', 'без',
-        'под', 'над', 'про', 'лишь', 'только', 'даже', 'уже', 'ну', 'во', 'от',
-        'кто', 'то', 'ли', 'ни', 'де', 'ми', 'те', 'бе', 'ре', 'ве',
-        'ви', 'ди', 'ле', 'ме', 'не', 'ре', 'се', 'те', 'че', 'ше',
-        'где', 'когда', 'чего', 'чему', 'чем', 'чей', 'чья', 'чьё', 'чьи', 'какой',
-        'такой', 'этот', 'мой', 'твой', 'его', 'её', 'их', 'наш', 'ваш', 'свой',
-        'один', 'два', 'три', 'четыре', 'пять', 'шесть', 'семь', 'восемь', 'девять', 'десять',
-        'ноль', 'нуль', 'первый', 'второй', 'третий', 'четвёртый', 'пятый', 'большой', 'малый', 'новый',
-        'старый', 'добрый', 'злой', 'хороший', 'плохой', 'красивый', 'умный', 'глупый', 'быстро', 'медленно',
-        'легкий', 'трудный', 'простой', 'сложный', 'горячий', 'холодный', 'светлый', 'темный', 'чистый', 'грязный',
-        'веселый', 'грустный', 'радостный', 'печальный', 'счастливый', 'несчастный', 'честный', 'лживый', 'правдивый', 'важный',
-        'интересный', 'скучный', 'ранний', 'поздний', 'дальний', 'ближний', 'левый', 'правый', 'верхний', 'нижний',
-        'дом', 'дверь', 'окно', 'стол', 'стул', 'кровать', 'книга', 'ручка', 'ручей', 'река',
-        'озеро', 'море', 'лес', 'поле', 'гора', 'город', 'улица', 'школа', 'мама', 'папа',
-        'брат', 'сестра', 'сын', 'дочь', 'муж', 'жена', 'друг', 'человек', 'люди', 'мальчик',
-        'девочка', 'девушка', 'юноша', 'старик', 'баба', 'бабушка', 'дедушка', 'врач', 'учитель', 'ученик',
-        'студент', 'работник', 'начальник', 'сосед', 'знакомый', 'враг', 'глаз', 'нос', 'рот', 'ухо',
-        'рука', 'нога', 'голова', 'волос', 'зуб', 'язык', 'сердце', 'печень', 'воздух', 'огонь',
-        'вода', 'земля', 'камень', 'песок', 'трава', 'цветок', 'дерево', 'лист', 'ветка', 'корень',
-        'хлеб', 'молоко', 'масло', 'мясо', 'рыба', 'яйцо', 'суп', 'каша', 'борщ', 'блюдо',
-        'чашка', 'ложка', 'вилка', 'нож', 'пища', 'еда', 'напиток', 'чай', 'кофе', 'вино',
-        'пиво', 'спирт', 'газ', 'пар', 'дым', 'запах', 'вкус', 'звук', 'музыка', 'песня',
-        'танец', 'картина', 'рисунок', 'фото', 'кино', 'театр', 'цирк', 'игра', 'спорт', 'мяч',
-        'лыжа', 'коньки', 'горка', 'елка', 'праздник', 'день', 'ночь', 'утро', 'вечер', 'час',
-        'минута', 'секунда', 'год', 'месяц', 'неделя', 'работа', 'дело', 'занятие', 'класс', 'урок',
-        'оценка', 'пятёрка', 'четвёрка', 'тройка', 'двойка', 'единица', 'экзамен', 'поэт', 'писатель', 'артист',
-        'певец', 'танцор', 'музыкант', 'художник', 'скульптор', 'архитектор', 'инженер', 'механик', 'электрик', 'сантехник',
-        'каменщик', 'плотник', 'кузнец', 'портной', 'сапожник', 'парикмахер', 'флорист', 'садовник', 'пастух', 'рыбак',
-        'охотник', 'летчик', 'капитан', 'матрос', 'солдат', 'офицер', 'генерал', 'король', 'королева', 'князь',
-        'граф', 'герцог', 'барон', 'дворянин', 'боярин', 'хозяин', 'хозяйка', 'слуга', 'служитель', 'раб',
-        'крестьянин', 'крестьянка', 'купец', 'ремесленник', 'безработный', 'инвалид', 'сирота', 'вдова', 'вдовец', 'холостяк',
-        'молодой', 'молодежь', 'молодость', 'возраст', 'старость', 'детство', 'много', 'немного', 'несколько', 'мало',
-        'совсем', 'вовсе', 'очень', 'весьма', 'сильно', 'слабо', 'почти', 'примерно', 'приблизительно', 'около',
-        'больше', 'меньше', 'лучше', 'хуже', 'быстрее', 'медленнее', 'выше', 'ниже', 'дальше', 'ближе',
-        'раньше', 'позже', 'скорее', 'разнообразнее', 'проще', 'сложнее', 'глубже', 'мельче', 'шире', 'уже',
-        'длиннее', 'короче', 'толще', 'тоньше', 'светлее', 'темнее', 'ярче', 'бледнее', 'красивее', 'некрасивее',
-        'странно', 'неправда', 'правда', 'конечно', 'наверное', 'может', 'возможно', 'невозможно', 'именно', 'точно',
-        'здесь', 'тут', 'туда', 'сюда', 'оттуда', 'отсюда', 'везде', 'всюду', 'нигде', 'никуда',
-        'откуда', 'кудаже', 'там', 'далеко', 'близко', 'рядом', 'вместе', 'отдельно', 'другой', 'иной',
-        'любой', 'никакой', 'всякий', 'известный', 'неизвестный', 'знаменитый', 'ужас', 'страх', 'страшный', 'ужасный',
-        'замечательно', 'отлично', 'весь', 'каждый', 'кое', 'сам', 'себя', 'себе', 'собой', 'собою',
-        'начинать', 'заканчивать', 'продолжать', 'останавливаться', 'ждать', 'искать', 'находить', 'терять', 'помнить', 'забывать',
-        'думать', 'верить', 'сомневаться', 'решать', 'выбирать', 'соглашаться', 'отказываться', 'спрашивать', 'отвечать', 'рассказывать',
-        'обещать', 'выполнять', 'нарушать', 'помогать', 'мешать', 'благодарить', 'извиняться', 'праздновать', 'печалиться', 'радоваться',
-        'удивляться', 'страдать', 'любить', 'ненавидеть', 'знать', 'понимать', 'говорить', 'читать', 'писать', 'слушать',
-        'смотреть', 'делать', 'работать', 'учиться', 'играть', 'ходить', 'бежать', 'прыгать', 'плавать', 'летать',
-        'ехать', 'приезжать', 'уезжать', 'приходить', 'уходить', 'сидеть', 'лежать', 'стоять', 'падать', 'вставать',
-        'ложиться', 'дать', 'взять', 'иметь', 'хотеть', 'нужно', 'надо', 'можно', 'нельзя', 'хорошо',
-        'плохо', 'красиво', 'да', 'нет', 'вот', 'или', 'союз', 'ле', 'те', 'ве',
-    }
\ No newline at end of file
+            if too_short_avg:
+                details.append(f"avg_len={avg_length:.2f}")
+
+            if too_few_long:
+                details.append(f"long_words={very_long_ratio * 100:.1f}%")
+
+            logger.info(
+                "Проверка на транслит: '%.50s...' (%d/3 критериев: %s) → %s",
+                text, criteria_met, ', '.join(details),
+                'TRANSLITERATION' if is_transliteration_result else 'REAL RUSSIAN'
+            )
+
+        return is_transliteration_result
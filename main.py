@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 import sys
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Iterator, List, Tuple
 
 from audio_extractor import AudioExtractor
 from speech_recognition_service import SpeechRecognitionService
 from segment_merger import SegmentMerger
 from subtitle_generator import SubtitleGenerator
+from transcription_segment import TranscriptionSegment
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -22,58 +27,148 @@ logger = logging.getLogger(__name__)
 MODEL_RU = "models/vosk-model-small-ru-0.22"
 MODEL_EN = "models/vosk-model-small-en-us-0.15"
 
+OUTPUT_DIR = Path("output")
+
+# Files decoded in the background while the current one is recognized. Recognition
+# is the slow stage, a deeper queue would only hold more PCM in memory
+EXTRACT_AHEAD = 1
+
+
+def extract_ahead(input_files: List[Path], workers: int) -> Iterator[Tuple[Path, Future]]:
+    """
+    Получение аудио дорожек в фоне, пока распознаётся предыдущий файл.
+
+    Отдаёт future с PCM, а не сам PCM: ошибка декодирования одного файла
+    поднимается при future.result() у вызывающего и не останавливает генератор.
+
+    Пока вызывающий обрабатывает текущий файл, в фоне декодируются следующие
+    workers файлов, так что в памяти одновременно не больше workers + 1 PCM,
+    а не PCM всей пачки.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        remaining = iter(input_files)
+
+        for input_file in islice(remaining, workers):
+            pending.append((input_file, executor.submit(AudioExtractor.extract_audio, input_file)))
+
+        while pending:
+            input_file, future = pending.popleft()
+
+            next_file = next(remaining, None)
+            if next_file is not None:
+                pending.append((next_file, executor.submit(AudioExtractor.extract_audio, next_file)))
+
+            yield input_file, future
+
+
+def recognize_both(
+        pcm: bytes,
+        service_ru: SpeechRecognitionService,
+        service_en: SpeechRecognitionService,
+        executor: ThreadPoolExecutor
+) -> Tuple[List[TranscriptionSegment], List[TranscriptionSegment]]:
+    """Распознавание одного PCM обеими моделями одновременно."""
+    # Vosk releases the GIL during decoding, so threads run both models in parallel
+    future_ru = executor.submit(service_ru.recognize_speech, pcm)
+    future_en = executor.submit(service_en.recognize_speech, pcm)
+
+    return future_ru.result(), future_en.result()
+
+
+def process_file(
+        input_file: Path,
+        pcm: bytes,
+        service_ru: SpeechRecognitionService,
+        service_en: SpeechRecognitionService,
+        executor: ThreadPoolExecutor
+) -> Path:
+    """Распознавание, объединение сегментов и запись субтитров для одного файла."""
+    logger.info(f"Начался процесс с файлом: {input_file}")
+
+    logger.info("Распознавание с моделями Русского и Английского языка...")
+    segments_ru, segments_en = recognize_both(pcm, service_ru, service_en, executor)
+
+    logger.info(f"Русский: {len(segments_ru)} сегмент")
+    logger.info(f"Английский: {len(segments_en)} сегмент")
+
+    # Merge and generate
+    merger = SegmentMerger()
+    final_segments = merger.merge_segments(segments_ru, segments_en)
+    logger.info(f"Объединённые сегменты: {len(final_segments)} segments")
+
+    # Output
+    output_path = OUTPUT_DIR / f"{input_file.stem}.srt"
+    generator = SubtitleGenerator()
+    generator.generate_srt(final_segments, output_path)
+
+    logger.info(f"✓ Субтитры сохранены в: {output_path}")
+
+    return output_path
+
+
+def batch_main(input_files: List[Path]) -> List[Path]:
+    """
+    Обработка пачки файлов с однократной загрузкой моделей.
+
+    Ошибка в одном файле логируется и не прерывает остальные.
+
+    return:
+        Файлы, которые не удалось обработать
+    """
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Load both models concurrently, loading is disk and C-bound
+        future_ru = executor.submit(SpeechRecognitionService, MODEL_RU)
+        future_en = executor.submit(SpeechRecognitionService, MODEL_EN)
+        service_ru = future_ru.result()
+        service_en = future_en.result()
+
+        try:
+            for input_file, pcm_future in extract_ahead(input_files, EXTRACT_AHEAD):
+                try:
+                    process_file(input_file, pcm_future.result(), service_ru, service_en, executor)
+                except Exception as e:
+                    logger.error(f"Ошибка при обработке файла {input_file}: {e}")
+                    failed.append(input_file)
+        finally:
+            service_ru.close()
+            service_en.close()
+
+    return failed
+
 
 def main():
     # Parse arguments
     if len(sys.argv) > 1:
-        input_file = Path(sys.argv[1])
+        input_files = [Path(arg) for arg in sys.argv[1:]]
     else:
         logger.info("Не задан файл")
         raise Exception("Не задан файл")
 
-    if not input_file.exists():
-        logger.error(f"Файл не найден: {input_file}")
+    for input_file in input_files:
+        if not input_file.exists():
+            logger.error(f"Файл не найден: {input_file}")
+            sys.exit(1)
+
+    # Subtitles are written to OUTPUT_DIR/<stem>.srt, equal stems would overwrite each other
+    files_by_stem = {}
+    for input_file in input_files:
+        files_by_stem.setdefault(input_file.stem, []).append(input_file)
+
+    duplicates = {stem: files for stem, files in files_by_stem.items() if len(files) > 1}
+    if duplicates:
+        for stem, files in duplicates.items():
+            logger.error(
+                f"Одинаковое имя субтитров {stem}.srt у файлов: {', '.join(map(str, files))}"
+            )
         sys.exit(1)
 
-    logger.info(f"Начался процесс с файлом: {input_file}")
-
-    # Extract audio
-    extractor = AudioExtractor()
-    audio_file = extractor.extract_audio(input_file)
-
-    try:
-        # Recognize with both models
-        logger.info("Распознавание с моделью Русского языка...")
-        service_ru = SpeechRecognitionService(MODEL_RU)
-        segments_ru = service_ru.recognize_speech(audio_file)
-        service_ru.close()
-        logger.info(f"Русский: {len(segments_ru)} сегмент")
-
-        logger.info("Распознавание с моделью Английского языка...")
-        service_en = SpeechRecognitionService(MODEL_EN)
-        segments_en = service_en.recognize_speech(audio_file)
-        service_en.close()
-        logger.info(f"Английский: {len(segments_en)} сегмент")
-
-        # Merge and generate
-        merger = SegmentMerger()
-        final_segments = merger.merge_segments(segments_ru, segments_en)
-        logger.info(f"Объединённые сегменты: {len(final_segments)} segments")
-
-        # Output
-        output_path = Path("output") / f"{input_file.stem}.srt"
-        generator = SubtitleGenerator()
-        generator.generate_srt(final_segments, output_path)
-
-        logger.info(f"✓ Субтитры сохранены в: {output_path}")
-
-    finally:
-        # Cleanup
-        try:
-            audio_file.unlink()
-            logger.info("Очистка временных файлов")
-        except:
-            pass
+    failed = batch_main(input_files)
+    if failed:
+        logger.error(f"Не удалось обработать {len(failed)} из {len(input_files)} файлов")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,53 @@
 import re
-from typing import List, Tuple, Optional
+from functools import cached_property, lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, Tuple, Optional
 import logging
+import numpy as np
 from transcription_segment import TranscriptionSegment
 from language_detector import LanguageDetector
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'[а-яА-ЯёЁa-zA-Z]+')
+_CYR_RE = re.compile(r'[а-яА-ЯёЁ]')
+
+# Bound once, the word-length stats probe it for every word
+_COMMON_RU = frozenset(LanguageDetector.COMMON_SHORT_RUSSIAN_WORDS)
+
+
+class _SegmentFeatures:
+    """
+    Результаты анализа текста сегмента.
+
+    Каждый признак вычисляется при первом обращении и один раз на сегмент,
+    поэтому правила выбора, завершившиеся раньше, не платят за остальные.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def lang(self) -> str:
+        return LanguageDetector.detect_language(self.text)
+
+    @cached_property
+    def quality(self) -> float:
+        return LanguageDetector.assess_quality(self.text)
+
+    @cached_property
+    def is_transliteration(self) -> bool:
+        return LanguageDetector.is_transliteration(self.text)
+
+    @property
+    def avg_word_length(self) -> float:
+        return SegmentMerger._get_avg_word_length(self.text)
+
+    @property
+    def short_word_ratio(self) -> float:
+        return SegmentMerger._get_short_word_ratio(self.text)
+
 
 class SegmentMerger:
     """
@@ -29,104 +71,181 @@ class SegmentMerger:
         if not segments_ru and not segments_en:
             return []
 
-        logger.debug(f"Объединение {len(segments_ru)} RU + {len(segments_en)} EN сегментов")
+        logger.debug("Объединение %d RU + %d EN сегментов", len(segments_ru), len(segments_en))
 
         merged = SegmentMerger.merge_overlapping_pairs(segments_ru, segments_en)
-        logger.debug(f"После слияния наложений: {len(merged)} сегментов")
+        logger.debug("После слияния наложений: %d сегментов", len(merged))
 
         merged = SegmentMerger.merge_adjacent_identical(merged)
-        logger.debug(f"После слияния соседних идентичных: {len(merged)} сегментов")
+        logger.debug("После слияния соседних идентичных: %d сегментов", len(merged))
 
         merged = SegmentMerger.remove_complete_duplicates(merged)
-        logger.debug(f"После удаления дубликатов: {len(merged)} сегментов")
+        logger.debug("После удаления дубликатов: %d сегментов", len(merged))
 
-        merged.sort(key=lambda s: s.start_time)
+        # Picks and unmatched EN segments are two mostly ordered runs, timsort merges them
+        merged.sort(key=attrgetter('start_time'))
 
         return merged
 
+    @staticmethod
+    def _index_by_start(
+            segments: List[TranscriptionSegment]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Индекс сегментов для поиска перекрытий бинарным поиском.
+
+        return:
+            order: индексы сегментов, отсортированные по start_time
+            starts: start_time в этом порядке
+            ends: end_time в этом порядке
+            max_ends: наибольший end_time среди сегментов до текущего включительно
+        """
+        starts = np.array([seg.start_time for seg in segments], dtype=np.float64)
+        ends = np.array([seg.end_time for seg in segments], dtype=np.float64)
+
+        order = np.argsort(starts, kind='stable')
+        ends = ends[order]
+
+        return order, starts[order], ends, np.maximum.accumulate(ends)
+
+    @staticmethod
+    def _candidate_overlaps(
+            ru_segments: List[TranscriptionSegment],
+            en_index: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+            overlap_threshold: float = OVERLAP_THRESHOLD
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Для каждого RU сегмента - пары (индекс EN сегмента, перекрытие) с перекрытием > порога.
+
+        Перекрываться с RU могут только EN сегменты, начинающиеся до конца RU
+        и заканчивающиеся после его начала. Такие окна находятся бинарным поиском
+        сразу для всех RU сегментов, а перекрытия всех пар из окон считаются
+        одним векторным выражением без построения полной матрицы RU x EN.
+        """
+        en_order, en_starts, en_ends, en_max_ends = en_index
+        ru_starts = np.array([seg.start_time for seg in ru_segments], dtype=np.float64)
+        ru_ends = np.array([seg.end_time for seg in ru_segments], dtype=np.float64)
+
+        lows = np.searchsorted(en_max_ends, ru_starts, side='right')
+        highs = np.searchsorted(en_starts, ru_ends, side='left')
+        counts = np.maximum(highs - lows, 0)
+
+        # Flatten the windows into (ru, en position) pairs
+        pair_ru = np.repeat(np.arange(len(ru_segments)), counts)
+        group_start = np.cumsum(counts) - counts
+        pair_pos = lows[pair_ru] + np.arange(len(pair_ru)) - group_start[pair_ru]
+
+        pair_ru_start = ru_starts[pair_ru]
+        pair_ru_end = ru_ends[pair_ru]
+        pair_en_start = en_starts[pair_pos]
+        pair_en_end = en_ends[pair_pos]
+
+        intersection = np.minimum(pair_ru_end, pair_en_end) - np.maximum(pair_ru_start, pair_en_start)
+        min_duration = np.minimum(pair_ru_end - pair_ru_start, pair_en_end - pair_en_start)
+
+        valid = (intersection > 0) & (min_duration > 0)
+        overlap = np.divide(intersection, min_duration, out=np.zeros_like(intersection), where=valid)
+        keep = np.flatnonzero(valid & (overlap > overlap_threshold))
+        keep_ru = pair_ru[keep]
+        keep_en = en_order[pair_pos[keep]]
+
+        # Visit each RU segment's candidates in en_segments order, so that on equal
+        # scores the earliest EN segment in the list wins even for unsorted input
+        by_list_order = np.lexsort((keep_en, keep_ru))
+
+        candidates = [[] for _ in ru_segments]
+        for ru_idx, en_idx, pair_overlap in zip(
+                keep_ru[by_list_order].tolist(),
+                keep_en[by_list_order].tolist(),
+                overlap[keep][by_list_order].tolist()
+        ):
+            candidates[ru_idx].append((en_idx, pair_overlap))
+
+        return candidates
+
     @staticmethod
     def _find_corresponding_segment(
             ru_segment: TranscriptionSegment,
             en_segments: List[TranscriptionSegment],
-            overlap_threshold: float = OVERLAP_THRESHOLD
-    ) -> Optional[TranscriptionSegment]:
+            en_candidates: List[Tuple[int, float]],
+            en_features: List[_SegmentFeatures]
+    ) -> Optional[Tuple[TranscriptionSegment, int]]:
         """
         Поиск наиболее подходящего английского сегмента для русского сегмента.
 
         Стратегия:
-        1. Вычислите временное перекрытие для всех сегментов EN
-        2. Найдите сегмент(ы) с наибольшим перекрытием
-        3. Верните сегмент с наилучшей оценкой качества, если перекрытие > порогового значения
-        4. Верните None, если не найдено подходящего совпадения
+        1. Перекрытия с RU выше порогового значения уже посчитаны в en_candidates
+        2. Верните сегмент с наилучшей оценкой по перекрытию и качеству
+        3. Верните None, если не найдено подходящего совпадения
 
         Agrs:
             ru_segment: русский сегмент для поиска
             en_segments: Список английских сегментов для поиска
-            overlap_threshold: Минимальный коэффициент перекрытия (0,0-1,0)
+            en_candidates: пары (индекс en_segments, перекрытие) из _candidate_overlaps
+            en_features: признаки en_segments (_SegmentFeatures)
 
         return:
-            Наилучшее соответствие фрагмента транскрипции или его отсутствие
+            Наилучший сегмент и его индекс в en_segments или None
         """
         if not en_segments:
-            logger.debug(
-                f"Нет EN сегментов для RU: '{ru_segment.text[:40]}...'"
-            )
+            logger.debug("Нет EN сегментов для RU: '%.40s...'", ru_segment.text)
             return None
 
         best_en_segment = None
+        best_idx = -1
         best_overlap = 0.0
         best_quality = 0.0
-        candidates = []
+        best_score = 0.0
 
-        for idx, en_segment in enumerate(en_segments):
-            overlap = SegmentMerger.calculate_overlap(ru_segment, en_segment)
+        for idx, overlap in en_candidates:
+            # Even a perfect quality can't beat the current best, skip the quality analysis
+            if overlap * 0.6 + 0.4 <= best_score:
+                continue
 
-            if overlap > overlap_threshold:
-                en_quality = LanguageDetector.assess_quality(en_segment.text)
-                combined_score = overlap * 0.6 + en_quality * 0.4
+            en_segment = en_segments[idx]
+            en_quality = en_features[idx].quality
+            combined_score = overlap * 0.6 + en_quality * 0.4
 
-                candidates.append({
-                    'segment': en_segment,
-                    'overlap': overlap,
-                    'quality': en_quality,
-                    'score': combined_score,
-                    'index': idx
-                })
+            if combined_score > best_score:
+                best_en_segment = en_segment
+                best_idx = idx
+                best_overlap = overlap
+                best_quality = en_quality
+                best_score = combined_score
 
-                if combined_score > (best_overlap * 0.6 + best_quality * 0.4):
-                    best_en_segment = en_segment
-                    best_overlap = overlap
-                    best_quality = en_quality
+                logger.debug(
+                    "  Кандидат #%d: перекрытие=%.2f, качество=%.2f, очки=%.2f '%.30s...'",
+                    idx + 1, overlap, en_quality, combined_score, en_segment.text
+                )
 
-                    logger.debug(
-                        f"  Кандидат #{idx + 1}: перекрытие={overlap:.2f}, "
-                        f"качество={en_quality:.2f}, очки={combined_score:.2f} "
-                        f"'{en_segment.text[:30]}...'"
-                    )
+                # Overlap and quality are both capped at 1.0, nothing later can score higher
+                if combined_score >= 1.0:
+                    break
 
         if best_en_segment:
             logger.debug(
-                f"  Найден соответствующий сегмент EN:\n"
-                f"  RU: {ru_segment.start_time:.2f}-{ru_segment.end_time:.2f} "
-                f"'{ru_segment.text[:40]}...'\n"
-                f"  EN: {best_en_segment.start_time:.2f}-{best_en_segment.end_time:.2f} "
-                f"'{best_en_segment.text[:40]}...'\n"
-                f"  перекрытие: {best_overlap:.2f}, качество: {best_quality:.2f}"
+                "  Найден соответствующий сегмент EN:\n"
+                "  RU: %.2f-%.2f '%.40s...'\n"
+                "  EN: %.2f-%.2f '%.40s...'\n"
+                "  перекрытие: %.2f, качество: %.2f",
+                ru_segment.start_time, ru_segment.end_time, ru_segment.text,
+                best_en_segment.start_time, best_en_segment.end_time, best_en_segment.text,
+                best_overlap, best_quality
+            )
+            return best_en_segment, best_idx
+
+        if en_candidates:
+            logger.debug(
+                "  Нет совпадений выше порога качества для RU: '%.40s...' "
+                "(%d кандидатов найдено)",
+                ru_segment.text, len(en_candidates)
             )
         else:
-            if candidates:
-                logger.debug(
-                    f"  Нет совпадений выше порога качества для RU: "
-                    f"'{ru_segment.text[:40]}...' "
-                    f"({len(candidates)} кандидатов найдено)"
-                )
-            else:
-                logger.debug(
-                    f" Не найдено EN сегментов перекрывающих RU: "
-                    f"'{ru_segment.text[:40]}...'"
-                )
+            logger.debug(
+                " Не найдено EN сегментов перекрывающих RU: '%.40s...'", ru_segment.text
+            )
 
-        return best_en_segment
+        return None
 
     @staticmethod
     def merge_overlapping_pairs(
@@ -137,43 +256,63 @@ class SegmentMerger:
        Для каждого RU сегмента находит перекрывающий EN сегмент и выберает наилучший.
         """
         result = []
-        used_en_indices = set()
+        # Dense flags instead of a set of ints, indices are 0..len-1 anyway
+        used_en = bytearray(len(segments_en))
+
+        en_index = SegmentMerger._index_by_start(segments_en)
+        candidates = SegmentMerger._candidate_overlaps(
+            segments_ru, en_index,
+            overlap_threshold=SegmentMerger.OVERLAP_THRESHOLD
+        )
 
-        for ru_seg in segments_ru:
-            en_seg = SegmentMerger._find_corresponding_segment(
-                ru_seg, segments_en,
-                overlap_threshold=SegmentMerger.OVERLAP_THRESHOLD
+        # Each feature is computed on first use and at most once per distinct text
+        feature_cache = {}
+        ru_features = [SegmentMerger._get_features(seg.text, feature_cache) for seg in segments_ru]
+        en_features = [SegmentMerger._get_features(seg.text, feature_cache) for seg in segments_en]
+
+        for ru_seg, ru_feat, en_candidates in zip(segments_ru, ru_features, candidates):
+            match = SegmentMerger._find_corresponding_segment(
+                ru_seg, segments_en, en_candidates, en_features
             )
 
-            if en_seg:
-                best_seg = SegmentMerger.select_best_segment(ru_seg, en_seg)
+            if match:
+                en_seg, en_idx = match
+                best_seg = SegmentMerger.select_best_segment(
+                    ru_seg, en_seg, ru_feat, en_features[en_idx]
+                )
                 logger.debug(
-                    f"Выбран: {best_seg.start_time:.2f}-{best_seg.end_time:.2f} "
-                    f"'{best_seg.text[:30]}...'"
+                    "Выбран: %.2f-%.2f '%.30s...'",
+                    best_seg.start_time, best_seg.end_time, best_seg.text
                 )
                 result.append(best_seg)
 
-                en_idx = segments_en.index(en_seg)
-                used_en_indices.add(en_idx)
+                used_en[en_idx] = 1
             else:
                 result.append(ru_seg)
 
         for en_idx, en_seg in enumerate(segments_en):
-            if en_idx not in used_en_indices:
-                lang_en = LanguageDetector.detect_language(en_seg.text)
-                quality_en = LanguageDetector.assess_quality(en_seg.text)
-                is_transliteration_en = LanguageDetector.is_transliteration(en_seg.text)
+            if not used_en[en_idx]:
+                en_feat = en_features[en_idx]
 
-                if (lang_en == "en" and not is_transliteration_en and
-                        quality_en > 0.5):
+                if (en_feat.lang == "en" and not en_feat.is_transliteration and
+                        en_feat.quality > 0.5):
                     result.append(en_seg)
                     logger.debug(
-                        f"Добавлен не перекрытый EN сегмент: {en_seg.start_time:.2f}-"
-                        f"{en_seg.end_time:.2f} '{en_seg.text[:30]}...'"
+                        "Добавлен не перекрытый EN сегмент: %.2f-%.2f '%.30s...'",
+                        en_seg.start_time, en_seg.end_time, en_seg.text
                     )
 
         return result
 
+    @staticmethod
+    def _get_features(text: str, cache: Dict[str, _SegmentFeatures]) -> _SegmentFeatures:
+        """Признаки текста сегмента, одинаковые тексты разделяют один анализ."""
+        features = cache.get(text)
+        if features is None:
+            features = cache[text] = _SegmentFeatures(text)
+
+        return features
+
     @staticmethod
     def calculate_overlap(
             seg1: TranscriptionSegment,
@@ -206,74 +345,77 @@ class SegmentMerger:
     @staticmethod
     def select_best_segment(
             seg_ru: TranscriptionSegment,
-            seg_en: TranscriptionSegment
+            seg_en: TranscriptionSegment,
+            features_ru: Optional[_SegmentFeatures] = None,
+            features_en: Optional[_SegmentFeatures] = None
     ) -> TranscriptionSegment:
         """
         Выбирает лучший сегмент в зависимости от языка, транслитерации и качества.
 
         Добавлены проверки на пригодность, позволяющие избежать выбора поврежденных сегментов.
+        Признаки сегментов вычисляются лениво (см. _SegmentFeatures): каждое правило
+        запрашивает только то, что ему нужно. Если признаки не переданы,
+        они создаются по тексту сегментов.
         """
-        lang_ru = LanguageDetector.detect_language(seg_ru.text)
-        lang_en = LanguageDetector.detect_language(seg_en.text)
-
-        quality_ru = LanguageDetector.assess_quality(seg_ru.text)
-        quality_en = LanguageDetector.assess_quality(seg_en.text)
-
-        is_transliteration_ru = LanguageDetector.is_transliteration(seg_ru.text)
-        is_transliteration_en = LanguageDetector.is_transliteration(seg_en.text)
+        if features_ru is None:
+            features_ru = _SegmentFeatures(seg_ru.text)
+        if features_en is None:
+            features_en = _SegmentFeatures(seg_en.text)
 
-        ru_avg_len = SegmentMerger._get_avg_word_length(seg_ru.text)
-        en_avg_len = SegmentMerger._get_avg_word_length(seg_en.text)
+        # Logging every feature would force all of them, only do it when it is shown
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Сравнение: RU(lang={features_ru.lang}, q={features_ru.quality:.2f}, "
+                f"транслит={features_ru.is_transliteration}, "
+                f"сред. длина={features_ru.avg_word_length:.2f}) "
+                f"vs EN(lang={features_en.lang}, q={features_en.quality:.2f}, "
+                f"транслит={features_en.is_transliteration}, "
+                f"сред. длина={features_en.avg_word_length:.2f})"
+            )
 
-        ru_short_ratio = SegmentMerger._get_short_word_ratio(seg_ru.text)
-        en_short_ratio = SegmentMerger._get_short_word_ratio(seg_en.text)
-
-        logger.debug(
-            f"Сравнение: RU(lang={lang_ru}, q={quality_ru:.2f}, "
-            f"транслит={is_transliteration_ru}, сред. длина={ru_avg_len:.2f}) "
-            f"vs EN(lang={lang_en}, q={quality_en:.2f}, "
-            f"транслит={is_transliteration_en}, сред. длина={en_avg_len:.2f})"
-        )
+        quality_ru = features_ru.quality
+        quality_en = features_en.quality
 
         #1: RU качество слишком низкое = явный не подходит
         if quality_ru < SegmentMerger.MIN_QUALITY_THRESHOLD and quality_en >= quality_ru:
             logger.debug(
-                f" Качество RU сегмента критически мало  ({quality_ru:.2f} < "
-                f"{SegmentMerger.MIN_QUALITY_THRESHOLD}), "
-                f"likely corrupted/garbage → SELECT EN"
+                " Качество RU сегмента критически мало  (%.2f < %s), "
+                "likely corrupted/garbage → SELECT EN",
+                quality_ru, SegmentMerger.MIN_QUALITY_THRESHOLD
             )
             return seg_en
 
         #2: EN качество намного лучше RU
         if quality_en > quality_ru + 0.25:
             logger.debug(
-                f" Качество EN значительно выше "
-                f"(EN={quality_en:.2f} vs RU={quality_ru:.2f}, diff=+{quality_en - quality_ru:.2f}) "
-                f" Выбран EN"
+                " Качество EN значительно выше (EN=%.2f vs RU=%.2f, diff=+%.2f)  Выбран EN",
+                quality_en, quality_ru, quality_en - quality_ru
             )
             return seg_en
 
         # Правило 1: Найдет чистый русский
-        if lang_ru == "ru" and not is_transliteration_ru:
-            if ru_avg_len > 4.5 and quality_ru >= SegmentMerger.MIN_QUALITY_THRESHOLD:
+        if features_ru.lang == "ru" and not features_ru.is_transliteration:
+            if (features_ru.avg_word_length > 4.5 and
+                    quality_ru >= SegmentMerger.MIN_QUALITY_THRESHOLD):
                 logger.debug(" Чисты русский с нормальным качеством и средней длиной слов → выбран RU")
                 return seg_ru
-            elif (ru_avg_len < 3.5 and en_avg_len > 4.0 and
-                  ru_short_ratio > 0.7):
+            elif (features_ru.avg_word_length < 3.5 and
+                  features_en.avg_word_length > 4.0 and
+                  features_ru.short_word_ratio > 0.7):
                 logger.debug(
-                    f" Скрытая транслитерация найдена: "
-                    f"RU avg={ru_avg_len:.2f} vs EN avg={en_avg_len:.2f} → выбран EN"
+                    " Скрытая транслитерация найдена: RU avg=%.2f vs EN avg=%.2f → выбран EN",
+                    features_ru.avg_word_length, features_en.avg_word_length
                 )
                 return seg_en
 
         # Правило 2: RU - транслит
-        if lang_ru == "ru" and is_transliteration_ru:
-            logger.debug(f" RU - это транслит → выбран EN")
+        if features_ru.lang == "ru" and features_ru.is_transliteration:
+            logger.debug(" RU - это транслит → выбран EN")
             return seg_en
 
         # Правило 3: Оба сегмента - русский язык
-        if lang_ru == "ru" and lang_en == "ru":
-            if is_transliteration_en and not is_transliteration_ru:
+        if features_ru.lang == "ru" and features_en.lang == "ru":
+            if features_en.is_transliteration and not features_ru.is_transliteration:
                 logger.debug(" Оба сегмента - русский язык, но EN - трансирован → выбран RU")
                 return seg_ru
             logger.debug(
@@ -282,70 +424,60 @@ class SegmentMerger:
             return seg_ru
 
         # Правило 4: Чистый EN
-        if lang_en == "en" and not is_transliteration_en:
-            if lang_ru == "en" or lang_ru == "mixed":
+        if features_en.lang == "en" and not features_en.is_transliteration:
+            if features_ru.lang == "en" or features_ru.lang == "mixed":
                 logger.debug(" EN - чистый английский, RU - смешанный или английский → выбран EN")
                 return seg_en
 
         # Правило 5: Проверка по качеству
-        if is_transliteration_ru and not is_transliteration_en:
+        if features_ru.is_transliteration and not features_en.is_transliteration:
             logger.debug(" RU - транслирован, EN чистый → выбран EN")
             return seg_en
 
         # Rule 6: Default choice
         choice = seg_ru if quality_ru >= quality_en else seg_en
         logger.debug(
-            f"→ Стандартный выбор по качеству: RU={quality_ru:.2f} "
-            f"vs EN={quality_en:.2f} → выбран {'RU' if choice == seg_ru else 'EN'}"
+            "→ Стандартный выбор по качеству: RU=%.2f vs EN=%.2f → выбран %s",
+            quality_ru, quality_en, 'RU' if choice == seg_ru else 'EN'
         )
         return choice
 
     @staticmethod
     def _get_avg_word_length(text: str) -> float:
         """Вычисление средней длины слов."""
-        words = re.findall(r'[а-яА-ЯёЁa-zA-Z]+', text.lower())
-
-        if not words:
-            return 0.0
-
-        if re.search(r'[а-яА-ЯёЁ]', text):
-            filtered_words = [
-                w for w in words
-                if w not in LanguageDetector.COMMON_SHORT_RUSSIAN_WORDS
-            ]
-
-            if not filtered_words:
-                return sum(len(w) for w in words) / len(words)
-
-            if all(len(w) <= 4 for w in filtered_words):
-                return sum(len(w) for w in filtered_words) / len(filtered_words)
-
-            return sum(len(w) for w in filtered_words) / len(filtered_words)
-
-        return sum(len(w) for w in words) / len(words)
+        return SegmentMerger._word_length_stats(text)[0]
 
     @staticmethod
     def _get_short_word_ratio(text: str) -> float:
         """Среднее количество слов меньше длинны = 3."""
-        words = re.findall(r'[а-яА-ЯёЁa-zA-Z]+', text.lower())
+        return SegmentMerger._word_length_stats(text)[1]
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _word_length_stats(text: str) -> Tuple[float, float]:
+        """
+        Средняя длина слов и доля коротких слов (<= 3) за одну токенизацию.
+
+        Для текста с кириллицей общеупотребительные русские слова не учитываются.
+        """
+        words = _WORD_RE.findall(text.lower())
 
         if not words:
-            return 0.0
+            return 0.0, 0.0
 
-        if re.search(r'[а-яА-ЯёЁ]', text):
-            filtered_words = [
-                w for w in words
-                if w not in LanguageDetector.COMMON_SHORT_RUSSIAN_WORDS
-            ]
+        if _CYR_RE.search(text):
+            filtered_words = [w for w in words if w not in _COMMON_RU]
 
             if not filtered_words:
-                return 1.0
+                return sum(len(w) for w in words) / len(words), 1.0
+
+            words = filtered_words
 
-            short_count = sum(1 for w in filtered_words if len(w) <= 3)
-            return short_count / len(filtered_words)
+        lengths = [len(w) for w in words]
+        avg_length = sum(lengths) / len(lengths)
+        short_ratio = sum(1 for length in lengths if length <= 3) / len(lengths)
 
-        short_count = sum(1 for w in words if len(w) <= 3)
-        return short_count / len(words)
+        return avg_length, short_ratio
 
     @staticmethod
     def merge_adjacent_identical(
@@ -355,21 +487,21 @@ class SegmentMerger:
         if not segments:
             return []
 
-        merged = [segments[0]]
-
-        for seg in segments[1:]:
-            last = merged[-1]
+        merged = []
+        gap_threshold = SegmentMerger.MERGE_GAP_THRESHOLD
 
-            if (seg.text == last.text and
-                    0 <= seg.start_time - last.end_time <=
-                    SegmentMerger.MERGE_GAP_THRESHOLD):
+        # Only runs of consecutive segments with the same text can merge
+        for _, run in groupby(segments, key=attrgetter('text')):
+            last = next(run)
+            merged.append(last)
 
-                last.end_time = seg.end_time
-                logger.debug(
-                    f"Объединение соседних сегментов: '{seg.text[:30]}...'"
-                )
-            else:
-                merged.append(seg)
+            for seg in run:
+                if 0 <= seg.start_time - last.end_time <= gap_threshold:
+                    last.end_time = seg.end_time
+                    logger.debug("Объединение соседних сегментов: '%.30s...'", seg.text)
+                else:
+                    merged.append(seg)
+                    last = seg
 
         return merged
 
@@ -382,46 +514,94 @@ class SegmentMerger:
             return segments
 
         result = []
-        used_indices = set()
+        # A container that was itself removed earlier no longer counts,
+        # this is what keeps one of two identical segments
+        removed = bytearray(len(segments))
 
-        for i, seg_i in enumerate(segments):
-            if i in used_indices:
-                continue
+        # Tokenize each text once instead of once per compared pair
+        word_sets = [frozenset(seg.text.lower().split()) for seg in segments]
+        set_sizes = [len(words) for words in word_sets]
+        containers = SegmentMerger._find_containers(segments)
 
-            is_duplicate = False
+        for i, seg_i in enumerate(segments):
+            text_i = seg_i.text
+            words_i = word_sets[i]
+            size_i = set_sizes[i]
 
-            for j, seg_j in enumerate(segments):
-                if i == j or j in used_indices:
+            for j in containers[i]:
+                if removed[j]:
                     continue
 
-                if (seg_j.start_time <= seg_i.start_time and
-                        seg_i.end_time <= seg_j.end_time and
-                        SegmentMerger.text_similarity(seg_i.text, seg_j.text) > 0.8):
+                if text_i == segments[j].text:
                     is_duplicate = True
-                    logger.debug(
-                        f"Удаление дубликатов: '{seg_i.text[:30]}...'"
+                else:
+                    # Jaccard never exceeds min/max of the set sizes, skip hopeless pairs
+                    size_j = set_sizes[j]
+                    is_duplicate = (
+                        min(size_i, size_j) > 0.8 * max(size_i, size_j) and
+                        SegmentMerger._text_similarity_sets(words_i, word_sets[j]) > 0.8
                     )
-                    used_indices.add(i)
-                    break
 
-            if not is_duplicate:
+                if is_duplicate:
+                    logger.debug("Удаление дубликатов: '%.30s...'", text_i)
+                    removed[i] = 1
+                    break
+            else:
                 result.append(seg_i)
 
         return result
 
+    @staticmethod
+    def _find_containers(segments: List[TranscriptionSegment]) -> List[List[int]]:
+        """
+        Для каждого сегмента - индексы других сегментов, целиком содержащих его по времени.
+
+        Сегменты обходятся по возрастанию начала (при равенстве - по убыванию конца),
+        сравнение идёт только с ещё не закончившимися к началу текущего сегмента.
+        """
+        # Parallel lists, the sweep reads times without attribute lookups
+        starts = [seg.start_time for seg in segments]
+        ends = [seg.end_time for seg in segments]
+
+        order = sorted(range(len(segments)), key=lambda k: (starts[k], -ends[k]))
+        containers = [[] for _ in segments]
+        active = []
+
+        for k in order:
+            start = starts[k]
+            end = ends[k]
+
+            # Segments that ended before this one starts can't contain it or anything later
+            active = [a for a in active if ends[a] >= start]
+
+            for a in active:
+                a_end = ends[a]
+                if a_end >= end:
+                    containers[k].append(a)
+
+                    # Identical intervals contain each other
+                    if a_end == end and starts[a] == start:
+                        containers[a].append(k)
+
+            active.append(k)
+
+        return containers
+
     @staticmethod
     def text_similarity(text1: str, text2: str) -> float:
         """Простое сходство текста, основанное на совпадающих словах."""
         if text1 == text2:
             return 1.0
 
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        return SegmentMerger._text_similarity_sets(
+            frozenset(text1.lower().split()),
+            frozenset(text2.lower().split())
+        )
 
+    @staticmethod
+    def _text_similarity_sets(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+        """Сходство по заранее подготовленным множествам слов (коэффициент Жаккара)."""
         if not words1 or not words2:
-            return 1.0 if text1 == text2 else 0.0
-
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
+            return 0.0
 
-        return intersection / union if union > 0 else 0.0
+        return len(words1 & words2) / len(words1 | words2)
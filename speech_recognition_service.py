@@ -1,12 +1,18 @@
-import json
-import wave
-from pathlib import Path
+import sys
+import threading
 from typing import List
+import numpy as np
 import vosk
 import logging
 
 from transcription_segment import TranscriptionSegment
 
+try:
+    # Faster parsing of the many small Vosk results when available
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +20,8 @@ class SpeechRecognitionService:
     """Распознавание голоса используя Vosk и создание сегментов по паузам."""
 
     SAMPLE_RATE = 16000
-    BUFFER_SIZE = 4000
+    SAMPLE_WIDTH = 2
+    BUFFER_SIZE = 32000  # samples per AcceptWaveform call, 2 s at 16kHz
     PAUSE_THRESHOLD = 0.5
     MAX_SEGMENT_LENGTH = 10.0
 
@@ -24,42 +31,57 @@ class SpeechRecognitionService:
         vosk.SetLogLevel(-1)
         self.model = vosk.Model(model_path)
 
-    def recognize_speech(self, audio_file: Path) -> List[TranscriptionSegment]:
-        """Распознание речи и деление на сегменты по паузам."""
-        logger.info(f"Распознание речи из{audio_file}")
+        # Recognizer is reused across files and reset before each one
+        self.recognizer = vosk.KaldiRecognizer(self.model, self.SAMPLE_RATE)
+        self.recognizer.SetWords(True)
+        self._lock = threading.Lock()
 
-        recognizer = vosk.KaldiRecognizer(self.model, self.SAMPLE_RATE)
-        recognizer.SetWords(True)
+    def recognize_speech(self, pcm: bytes) -> List[TranscriptionSegment]:
+        """
+        Распознание речи из PCM s16le MONO 16kHz и деление на сегменты по паузам.
 
-        words_info = []
+        Распознаватель общий для всех вызовов, поэтому одновременные вызовы
+        одного сервиса из разных потоков выполняются по очереди.
+        """
+        logger.info(f"Распознание речи из {len(pcm)} байт PCM")
 
-        with wave.open(str(audio_file), "rb") as wav_file:
-            while True:
-                data = wav_file.readframes(self.BUFFER_SIZE)
-                if len(data) == 0:
-                    break
+        with self._lock:
+            words_info = self._decode_words(pcm)
 
-                if recognizer.AcceptWaveform(data):
-                    result = recognizer.Result()
-                    words_info.extend(self._extract_words(result))
+        segments = self._create_segments_by_pauses(words_info)
+        logger.info(f"Создано {len(segments)} сегментов")
 
+        return segments
 
-        final_result = recognizer.FinalResult()
-        words_info.extend(self._extract_words(final_result))
+    def _decode_words(self, pcm: bytes) -> list:
+        """Прогон PCM через распознаватель и сбор информации о словах."""
+        recognizer = self.recognizer
+        recognizer.Reset()
 
+        words_info = []
 
-        segments = self._create_segments_by_pauses(words_info)
-        logger.info(f"Создано {len(segments)} сегментов")
+        # Bound once, the loop runs for every chunk of the file
+        accept_waveform = recognizer.AcceptWaveform
+        get_result = recognizer.Result
+        extract_words = self._extract_words
 
-        return segments
+        chunk_size = self.BUFFER_SIZE * self.SAMPLE_WIDTH
+        for offset in range(0, len(pcm), chunk_size):
+            if accept_waveform(pcm[offset:offset + chunk_size]):
+                words_info.extend(extract_words(get_result()))
+
+        final_result = recognizer.FinalResult()
+        words_info.extend(extract_words(final_result))
+
+        return words_info
 
     def _extract_words(self, json_result: str) -> list:
         """Получение информации о словах из JSON."""
         try:
-            result = json.loads(json_result)
+            result = json_loads(json_result)
             words = result.get("result", [])
             return words
-        except:
+        except ValueError:
             return []
 
     def _create_segments_by_pauses(self, words: list) -> List[TranscriptionSegment]:
@@ -67,34 +89,21 @@ class SpeechRecognitionService:
         if not words:
             return []
 
-        segments = []
-        current_segment = []
-
-        for word in words:
-            word_text = word.get("word", "")
-            word_start = word.get("start", 0)
-            word_end = word.get("end", 0)
+        starts = np.fromiter((w.get("start", 0) for w in words), dtype=np.float64, count=len(words))
+        ends = np.fromiter((w.get("end", 0) for w in words), dtype=np.float64, count=len(words))
 
-            if current_segment:
-                pause = word_start - current_segment[-1].get("end", 0)
-                if pause > self.PAUSE_THRESHOLD:
-                    # Create segment from accumulated words
-                    segment_text = " ".join([w.get("word", "") for w in current_segment])
-                    segment_start = current_segment[0].get("start", 0)
-                    segment_end = current_segment[-1].get("end", 0)
-
-                    if segment_text.strip():
-                        segments.append(TranscriptionSegment(segment_start, segment_end, segment_text))
-
-                    current_segment = []
-
-            current_segment.append(word)
+        # A new segment begins at every word that follows a long enough pause
+        breaks = np.flatnonzero(starts[1:] - ends[:-1] > self.PAUSE_THRESHOLD) + 1
+        bounds = [0, *breaks.tolist(), len(words)]
 
+        segments = []
 
-        if current_segment:
-            segment_text = " ".join([w.get("word", "") for w in current_segment])
-            segment_start = current_segment[0].get("start", 0)
-            segment_end = current_segment[-1].get("end", 0)
+        for lo, hi in zip(bounds, bounds[1:]):
+            group = words[lo:hi]
+            # Interned, merging compares segment texts many times
+            segment_text = sys.intern(" ".join([w.get("word", "") for w in group]))
+            segment_start = group[0].get("start", 0)
+            segment_end = group[-1].get("end", 0)
 
             if segment_text.strip():
                 segments.append(TranscriptionSegment(segment_start, segment_end, segment_text))
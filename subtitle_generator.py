@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import List
 import logging
+import numpy as np
 from transcription_segment import TranscriptionSegment
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,8 @@ logger = logging.getLogger(__name__)
 class SubtitleGenerator:
     """Создание SRT файла с субтитрами."""
 
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
     @staticmethod
     def generate_srt(segments: List[TranscriptionSegment], output_path: Path):
 
@@ -16,24 +19,33 @@ class SubtitleGenerator:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for index, seg in enumerate(segments, 1):
-                start_time = SubtitleGenerator._format_time(seg.start_time)
-                end_time = SubtitleGenerator._format_time(seg.end_time)
+        start_times = SubtitleGenerator._format_times([seg.start_time for seg in segments])
+        end_times = SubtitleGenerator._format_times([seg.end_time for seg in segments])
+
+        content = "".join([
+            f"{index}\n{start_time} --> {end_time}\n{seg.text}\n\n"
+            for index, (seg, start_time, end_time)
+            in enumerate(zip(segments, start_times, end_times), 1)
+        ])
 
-                f.write(f"{index}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{seg.text}\n")
-                f.write("\n")
+        # One encode and write for the whole file, SRT files are small
+        buffering = SubtitleGenerator.WRITE_BUFFER_SIZE
+        with open(output_path, 'w', encoding='utf-8', buffering=buffering) as f:
+            f.write(content)
 
         logger.info(f"SRT file created: {output_path}")
 
     @staticmethod
-    def _format_time(seconds: float) -> str:
-        """Конвертация секунд в SRT время формата HH:MM:SS,mmm."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
\ No newline at end of file
+    def _format_times(times: List[float]) -> List[str]:
+        """Конвертация секунд в SRT время формата HH:MM:SS,mmm для всех отметок сразу."""
+        seconds = np.array(times, dtype=np.float64)
+
+        hours = (seconds // 3600).astype(np.int64)
+        minutes = ((seconds % 3600) // 60).astype(np.int64)
+        secs = (seconds % 60).astype(np.int64)
+        millis = ((seconds % 1) * 1000).astype(np.int64)
+
+        return [
+            f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+            for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+        ]
@@ -1,6 +1,9 @@
 class TranscriptionSegment:
     """Выделение одного сегмента распознанной речи с помощью временных кодов."""
 
+    # Many instances per file, no per-instance __dict__
+    __slots__ = ('start_time', 'end_time', 'text')
+
     def __init__(self, start_time: float, end_time: float, text: str):
         self.start_time = start_time
         self.end_time = end_time